@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, filedialog
+from tkinter import messagebox, scrolledtext, filedialog, simpledialog
 from PIL import Image, ImageTk
 try:
     from PIL.Image import Resampling
@@ -14,11 +14,32 @@ from reportlab.lib import colors
 from reportlab.platypus import Table, TableStyle, Paragraph
 from reportlab.lib.styles import ParagraphStyle
 import math
+import json
+import os
+import zipfile
 
 LOGO_PATH = "logo.png"
 MAX_DYNAMIC_FIELDS = 10
 
 last_calc_data = None  # (inputs, results, debug)
+current_project = None  # (filename, dwelling name) of the last saved/opened project
+_loading_project = False  # suppresses per-field trace work while a project is applied
+
+# Widgets built in the __main__ UI setup that the module-level refresh helpers update
+area_label_main = None
+suite_area_label = None
+suite_frame = None
+
+PROJECT_EXT = ".dcp"
+PROJECT_FORMAT = "demand-calculator-project"
+PROJECT_VERSION = 1
+PROJECT_MANIFEST = "manifest.json"
+PROJECT_FIELDS = (
+    "voltage", "area", "range", "heat", "ac", "evse", "tankless_main",
+    "suite_area", "suite_range", "suite_evse", "tankless_suite",
+)
+PROJECT_TOGGLES = ("area_sqft", "interlock", "suite")
+PROJECT_LISTS = ("additional_main", "sps_main", "additional_suite", "sps_suite")
 
 # ----------------------------- Helpers -----------------------------
 
@@ -74,6 +95,127 @@ def to_watts_list(vars_list, voltage):
             out.append(parse_load(s, voltage))
     return out
 
+# -------------------------- Project Files --------------------------
+#
+# A project is a zip archive holding a small manifest plus one compact JSON
+# member per dwelling. The manifest is read first, so a single dwelling can be
+# opened from a multi-dwelling archive without decompressing the others.
+
+def _dumps_compact(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def _next_dwelling_member(taken):
+    i = 0
+    while f"dwellings/{i}.json" in taken:
+        i += 1
+    return f"dwellings/{i}.json"
+
+def _read_manifest(zf):
+    """Return the manifest dict of an open project archive, validating its version."""
+    manifest = json.loads(zf.read(PROJECT_MANIFEST).decode("utf-8"))
+    if not isinstance(manifest, dict) or manifest.get("format") != PROJECT_FORMAT:
+        raise ValueError("Not a demand calculator project file.")
+    version = manifest.get("version")
+    if type(version) is not int or not 1 <= version <= PROJECT_VERSION:
+        raise ValueError(f"Unsupported project version: {version}")
+    dwellings = manifest.get("dwellings")
+    if not isinstance(dwellings, list):
+        raise ValueError("Project manifest has no dwelling list.")
+    for d in dwellings:
+        if not (isinstance(d, dict) and isinstance(d.get("name"), str) and isinstance(d.get("member"), str)):
+            raise ValueError("Project manifest has a malformed dwelling entry.")
+    return manifest
+
+def _toggle_value(v):
+    """0/1 from a stored toggle; accepts ints, bools and numeric strings."""
+    try:
+        return int(bool(int(v)))
+    except (TypeError, ValueError):
+        return 0
+
+def normalize_dwelling_state(state):
+    """Return a clean copy of a dwelling's form state.
+
+    Missing fields default to blank/off, dynamic lists are trimmed of
+    trailing blanks and capped at MAX_DYNAMIC_FIELDS.
+    """
+    fields = state.get("fields", {})
+    toggles = state.get("toggles", {})
+    lists = state.get("lists", {})
+    out = {
+        "fields": {k: "" if fields.get(k) is None else str(fields[k]) for k in PROJECT_FIELDS},
+        "toggles": {k: _toggle_value(toggles.get(k, 0)) for k in PROJECT_TOGGLES},
+        "lists": {},
+    }
+    for k in PROJECT_LISTS:
+        values = [str(v) for v in lists.get(k, [])][:MAX_DYNAMIC_FIELDS]
+        while values and not values[-1].strip():
+            values.pop()
+        out["lists"][k] = values
+    return out
+
+def list_project_dwellings(filename):
+    """Return the dwelling names stored in a project archive, in save order."""
+    with zipfile.ZipFile(filename) as zf:
+        return [d["name"] for d in _read_manifest(zf)["dwellings"]]
+
+def read_project_dwelling(filename, name=None):
+    """Load one dwelling's form state; the first dwelling if name is None."""
+    with zipfile.ZipFile(filename) as zf:
+        dwellings = _read_manifest(zf)["dwellings"]
+        if not dwellings:
+            raise ValueError("Project contains no dwellings.")
+        if name is None:
+            entry = dwellings[0]
+        else:
+            matches = [d for d in dwellings if d["name"] == name]
+            if not matches:
+                raise KeyError(f"No dwelling named {name!r} in project.")
+            entry = matches[0]
+        state = json.loads(zf.read(entry["member"]).decode("utf-8"))
+    return normalize_dwelling_state(state)
+
+def write_project_dwelling(filename, name, state, replace_file=False):
+    """Save one dwelling into a project archive, creating it if needed.
+
+    Other dwellings already in the archive are copied across as raw bytes
+    without being parsed; a dwelling with the same name is replaced and
+    manifest entries whose member is missing are dropped. A file that is not
+    a project at all (not a zip, or no manifest) is overwritten. A project
+    this version cannot read raises ValueError and is left untouched, unless
+    replace_file is set, in which case the file is overwritten regardless.
+    """
+    entries, kept = [], {}
+    if os.path.exists(filename) and not replace_file:
+        try:
+            zf = zipfile.ZipFile(filename)
+        except zipfile.BadZipFile:
+            zf = None
+        if zf is not None:
+            with zf:
+                names = zf.namelist()
+                if PROJECT_MANIFEST in names:
+                    for d in _read_manifest(zf)["dwellings"]:
+                        if d["name"] != name and d["member"] in names:
+                            entries.append(d)
+                            kept[d["member"]] = zf.read(d["member"])
+    member = _next_dwelling_member(kept)
+    entries.append({"name": name, "member": member})
+    manifest = {"format": PROJECT_FORMAT, "version": PROJECT_VERSION, "dwellings": entries}
+
+    tmp = filename + ".tmp"
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(PROJECT_MANIFEST, _dumps_compact(manifest))
+            for m, data in kept.items():
+                zf.writestr(m, data)
+            zf.writestr(member, _dumps_compact(normalize_dwelling_state(state)))
+        os.replace(tmp, filename)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
 # ------------------------- Calculation Core ------------------------
 
 def calculate_demand():
@@ -243,8 +385,19 @@ def calculate_demand():
 
 # ----------------------------- Dynamic UI helpers -----------------------------
 
+def update_area_labels():
+    unit = "ft²" if area_sqft_var.get() else "m²"
+    area_label_main.config(text=f"Main Area ({unit}):")
+    if suite_area_label:
+        suite_area_label.config(text=f"Suite Area ({unit}):")
+
+def toggle_suite():
+    suite_frame.grid() if suite_var.get() else suite_frame.grid_remove()
+
 def add_dynamic_row_if_needed(vars_list, entries_list):
     """Show first row by default; when last visible has text, show one more (up to cap). Hide trailing empties."""
+    if _loading_project:
+        return
     # last non-empty index
     last_nonempty = -1
     for i, v in enumerate(vars_list):
@@ -427,6 +580,145 @@ def save_pdf_report():
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save PDF:\n{e}")
 
+# ----------------------------- Project Save/Open -----------------------------
+
+def _project_vars():
+    """Map project state keys to the live Tk variables/lists of the form."""
+    fields = {
+        "voltage": voltage_var, "area": area_var,
+        "range": range_var, "heat": heat_var, "ac": ac_var, "evse": evse_var,
+        "tankless_main": tankless_var_main,
+        "suite_area": suite_area_var, "suite_range": suite_range_var,
+        "suite_evse": suite_evse_var, "tankless_suite": tankless_var_suite,
+    }
+    toggles = {"area_sqft": area_sqft_var, "interlock": interlock_var, "suite": suite_var}
+    lists = {
+        "additional_main": (additional_vars_main, additional_entries_main),
+        "sps_main": (sps_vars_main, sps_entries_main),
+        "additional_suite": (additional_vars_suite, additional_entries_suite),
+        "sps_suite": (sps_vars_suite, sps_entries_suite),
+    }
+    return fields, toggles, lists
+
+def collect_form_state():
+    fields, toggles, lists = _project_vars()
+    return normalize_dwelling_state({
+        "fields": {k: v.get() for k, v in fields.items()},
+        "toggles": {k: v.get() for k, v in toggles.items()},
+        "lists": {k: [v.get() for v in vars_list] for k, (vars_list, _) in lists.items()},
+    })
+
+def apply_form_state(state):
+    """Repopulate every form variable, then refresh the dependent widgets once."""
+    global _loading_project
+    state = normalize_dwelling_state(state)
+    fields, toggles, lists = _project_vars()
+    _loading_project = True
+    try:
+        for k, var in fields.items():
+            var.set(state["fields"][k])
+        for k, var in toggles.items():
+            var.set(state["toggles"][k])
+        for k, (vars_list, _) in lists.items():
+            values = state["lists"][k]
+            for i, var in enumerate(vars_list):
+                var.set(values[i] if i < len(values) else "")
+    finally:
+        _loading_project = False
+    for vars_list, entries_list in lists.values():
+        add_dynamic_row_if_needed(vars_list, entries_list)
+    update_area_labels()
+    toggle_suite()
+
+def save_project():
+    global current_project
+    dialog_opts = {}
+    if current_project:
+        dialog_opts = {
+            "initialdir": os.path.dirname(os.path.abspath(current_project[0])),
+            "initialfile": os.path.basename(current_project[0]),
+        }
+    filename = filedialog.asksaveasfilename(
+        defaultextension=PROJECT_EXT,
+        filetypes=[("Demand Calculator projects", f"*{PROJECT_EXT}")],
+        title="Save Project",
+        **dialog_opts
+    )
+    if not filename:
+        return
+    if current_project and os.path.abspath(current_project[0]) == os.path.abspath(filename):
+        default_name = current_project[1]
+    else:
+        default_name = os.path.splitext(os.path.basename(filename))[0]
+    name = simpledialog.askstring("Dwelling Name", "Save this dwelling as:",
+                                  initialvalue=default_name, parent=root)
+    if name is None:
+        return
+    name = name.strip() or default_name
+    existing, replace_file = [], False
+    if os.path.exists(filename):
+        try:
+            existing = list_project_dwellings(filename)
+        except Exception as e:
+            if not messagebox.askyesno(
+                    "Overwrite File",
+                    f"'{os.path.basename(filename)}' is not a readable project ({e}).\n"
+                    "Overwrite it? Any dwellings it holds will be lost."):
+                return
+            replace_file = True
+    if name in existing and not messagebox.askyesno(
+            "Replace Dwelling", f"A dwelling named '{name}' already exists in this project.\nReplace it?"):
+        return
+    try:
+        write_project_dwelling(filename, name, collect_form_state(), replace_file=replace_file)
+        current_project = (filename, name)
+        messagebox.showinfo("Saved", f"Project saved to:\n{filename}")
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to save project:\n{e}")
+
+def choose_dwelling(names):
+    """Modal list of dwelling names; returns the selected name or None."""
+    win = tk.Toplevel()
+    win.title("Open Dwelling")
+    win.transient(root)
+    lb = tk.Listbox(win, width=40, height=min(len(names), 15))
+    for n in names:
+        lb.insert(tk.END, n)
+    lb.selection_set(0)
+    lb.pack(fill="both", expand=True, padx=10, pady=(10,4))
+    chosen = []
+    def ok(*_):
+        sel = lb.curselection()
+        if sel:
+            chosen.append(names[sel[0]])
+        win.destroy()
+    lb.bind("<Double-Button-1>", ok)
+    tk.Button(win, text="Open", command=ok).pack(pady=(0,10))
+    win.grab_set()
+    win.wait_window()
+    return chosen[0] if chosen else None
+
+def open_project():
+    global current_project, last_calc_data
+    filename = filedialog.askopenfilename(
+        filetypes=[("Demand Calculator projects", f"*{PROJECT_EXT}")],
+        title="Open Project"
+    )
+    if not filename:
+        return
+    try:
+        names = list_project_dwellings(filename)
+        if not names:
+            raise ValueError("Project contains no dwellings.")
+        name = names[0] if len(names) == 1 else choose_dwelling(names)
+        if name is None:
+            return
+        apply_form_state(read_project_dwelling(filename, name))
+        current_project = (filename, name)
+        last_calc_data = None
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to open project:\n{e}")
+
 def show_debug_popup(debug_lines):
     win = tk.Toplevel()
     win.title("Calculation Details")
@@ -445,7 +737,10 @@ def show_help():
         "treated as breaker amps).\n\n"
         "Use 'Calculate Demand' to perform the calculation and view details.\n"
         "After a calculation, 'Generate PDF Report' saves a summary of the inputs "
-        "and results."
+        "and results.\n\n"
+        "'Save Project' stores all entered values in a project file; 'Open Project' "
+        "restores them. Saving asks for a dwelling name; a new name adds another "
+        "dwelling to the same project file."
     )
     messagebox.showinfo("Help", help_text)
 
@@ -497,14 +792,7 @@ if __name__ == "__main__":
         tk.Entry(frm, textvariable=var, width=width).pack(side='left')
         row += 1
 
-    area_label_main = None
-    suite_area_label = None
     area_sqft_var = tk.IntVar()
-    def update_area_labels():
-        unit = "ft²" if area_sqft_var.get() else "m²"
-        area_label_main.config(text=f"Main Area ({unit}):")
-        if suite_area_label:
-            suite_area_label.config(text=f"Suite Area ({unit}):")
 
     # Site Info
     section_label("Site Info")
@@ -579,8 +867,6 @@ if __name__ == "__main__":
     # Secondary Suite
     section_label("Secondary Suite")
     suite_var = tk.IntVar()
-    def toggle_suite():
-        suite_frame.grid() if suite_var.get() else suite_frame.grid_remove()
     frm_suite_cb = tk.Frame(content); frm_suite_cb.grid(row=row, column=0, sticky='w', padx=10, pady=2)
     tk.Checkbutton(frm_suite_cb, text="Include Secondary Suite", variable=suite_var, command=toggle_suite).pack(side='left')
     row += 1
@@ -649,7 +935,9 @@ if __name__ == "__main__":
     # Buttons
     btn_frame = tk.Frame(content); btn_frame.grid(row=row, column=0, sticky='w', padx=10, pady=12)
     tk.Button(btn_frame, text="Calculate Demand", command=calculate_demand).pack(side='left', padx=(0,10))
-    tk.Button(btn_frame, text="Generate PDF Report", command=save_pdf_report).pack(side='left')
+    tk.Button(btn_frame, text="Generate PDF Report", command=save_pdf_report).pack(side='left', padx=(0,10))
+    tk.Button(btn_frame, text="Save Project", command=save_project).pack(side='left', padx=(0,10))
+    tk.Button(btn_frame, text="Open Project", command=open_project).pack(side='left')
     # Size the window to fit all initial content before starting the event loop
     root.update_idletasks()
     req_w = content.winfo_reqwidth() + v_scroll.winfo_reqwidth()
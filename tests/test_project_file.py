@@ -0,0 +1,181 @@
+import json
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from demand import (
+    PROJECT_MANIFEST,
+    list_project_dwellings,
+    normalize_dwelling_state,
+    read_project_dwelling,
+    write_project_dwelling,
+)
+
+
+def make_state(area="120", additional=("5000", "4500")):
+    return {
+        "fields": {"voltage": "240", "area": area, "range": "40"},
+        "toggles": {"area_sqft": 1, "suite": 0},
+        "lists": {"additional_main": list(additional)},
+    }
+
+
+def test_round_trip_single_dwelling(tmp_path):
+    path = str(tmp_path / "house.dcp")
+    write_project_dwelling(path, "House", make_state())
+    state = read_project_dwelling(path)
+    assert state["fields"]["area"] == "120"
+    assert state["fields"]["heat"] == ""
+    assert state["toggles"] == {"area_sqft": 1, "interlock": 0, "suite": 0}
+    assert state["lists"]["additional_main"] == ["5000", "4500"]
+    assert state["lists"]["sps_suite"] == []
+
+
+def test_normalize_trims_trailing_blanks_and_caps_length():
+    state = normalize_dwelling_state({"lists": {"sps_main": ["1", "", "2", "", " "]}})
+    assert state["lists"]["sps_main"] == ["1", "", "2"]
+    state = normalize_dwelling_state({"lists": {"sps_main": [str(i) for i in range(1, 30)]}})
+    assert len(state["lists"]["sps_main"]) == 10
+
+
+def test_multiple_dwellings_and_replace(tmp_path):
+    path = str(tmp_path / "street.dcp")
+    write_project_dwelling(path, "Lot 1", make_state(area="100"))
+    write_project_dwelling(path, "Lot 2", make_state(area="200"))
+    write_project_dwelling(path, "Lot 1", make_state(area="150"))
+    assert list_project_dwellings(path) == ["Lot 2", "Lot 1"]
+    assert read_project_dwelling(path, "Lot 1")["fields"]["area"] == "150"
+    assert read_project_dwelling(path, "Lot 2")["fields"]["area"] == "200"
+
+
+def test_open_one_dwelling_without_parsing_others(tmp_path):
+    path = str(tmp_path / "street.dcp")
+    write_project_dwelling(path, "Good", make_state())
+    write_project_dwelling(path, "Other", make_state())
+    # Corrupt the other dwelling's member; opening "Good" must still work.
+    with zipfile.ZipFile(path) as zf:
+        members = {n: zf.read(n) for n in zf.namelist()}
+    other = [n for n in members if n != PROJECT_MANIFEST][-1]
+    members[other] = b"not json"
+    with zipfile.ZipFile(path, "w") as zf:
+        for n, data in members.items():
+            zf.writestr(n, data)
+    assert read_project_dwelling(path, "Good")["fields"]["area"] == "120"
+
+
+def test_unknown_dwelling_raises(tmp_path):
+    path = str(tmp_path / "house.dcp")
+    write_project_dwelling(path, "House", make_state())
+    with pytest.raises(KeyError):
+        read_project_dwelling(path, "Garage")
+
+
+def test_newer_version_rejected(tmp_path):
+    path = str(tmp_path / "future.dcp")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(PROJECT_MANIFEST, '{"format":"demand-calculator-project","version":99,"dwellings":[]}')
+    with pytest.raises(ValueError):
+        list_project_dwellings(path)
+
+
+def test_normalize_null_fields_and_string_toggles():
+    state = normalize_dwelling_state({
+        "fields": {"area": None, "range": 40},
+        "toggles": {"suite": "0", "interlock": "1", "area_sqft": "yes"},
+    })
+    assert state["fields"]["area"] == ""
+    assert state["fields"]["range"] == "40"
+    assert state["toggles"] == {"area_sqft": 0, "interlock": 1, "suite": 0}
+
+
+@pytest.mark.parametrize("version", [0, -1, True, "1", None])
+def test_invalid_version_rejected(tmp_path, version):
+    path = str(tmp_path / "bad.dcp")
+    manifest = {"format": "demand-calculator-project", "version": version, "dwellings": []}
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(PROJECT_MANIFEST, json.dumps(manifest))
+    with pytest.raises(ValueError):
+        list_project_dwellings(path)
+
+
+def test_save_overwrites_file_that_is_not_a_project(tmp_path):
+    path = str(tmp_path / "junk.dcp")
+    with open(path, "wb") as f:
+        f.write(b"not a zip")
+    write_project_dwelling(path, "House", make_state())
+    assert list_project_dwellings(path) == ["House"]
+
+
+def test_save_drops_entries_with_missing_member(tmp_path):
+    path = str(tmp_path / "broken.dcp")
+    manifest = {
+        "format": "demand-calculator-project", "version": 1,
+        "dwellings": [{"name": "Ghost", "member": "dwellings/0.json"}],
+    }
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(PROJECT_MANIFEST, json.dumps(manifest))
+    write_project_dwelling(path, "House", make_state())
+    assert list_project_dwellings(path) == ["House"]
+
+
+def test_failed_save_removes_temp_file(tmp_path):
+    path = str(tmp_path / "house.dcp")
+    with pytest.raises(TypeError):
+        write_project_dwelling(path, "House", {"lists": {"sps_main": 5}})
+    assert os.listdir(str(tmp_path)) == []
+
+
+def rewrite_manifest(path, update):
+    with zipfile.ZipFile(path) as zf:
+        members = {n: zf.read(n) for n in zf.namelist()}
+    manifest = json.loads(members[PROJECT_MANIFEST])
+    update(manifest)
+    members[PROJECT_MANIFEST] = json.dumps(manifest).encode("utf-8")
+    with zipfile.ZipFile(path, "w") as zf:
+        for n, data in members.items():
+            zf.writestr(n, data)
+
+
+def test_save_into_newer_version_raises_and_keeps_file(tmp_path):
+    path = str(tmp_path / "street.dcp")
+    write_project_dwelling(path, "A", make_state())
+    write_project_dwelling(path, "B", make_state())
+    rewrite_manifest(path, lambda m: m.update(version=2))
+    with open(path, "rb") as f:
+        before = f.read()
+    with pytest.raises(ValueError):
+        write_project_dwelling(path, "C", make_state())
+    with open(path, "rb") as f:
+        assert f.read() == before
+    assert os.listdir(str(tmp_path)) == ["street.dcp"]
+
+
+def test_save_with_malformed_entry_raises_and_keeps_file(tmp_path):
+    path = str(tmp_path / "street.dcp")
+    write_project_dwelling(path, "A", make_state())
+    rewrite_manifest(path, lambda m: m["dwellings"].append({"member": "dwellings/9.json"}))
+    with open(path, "rb") as f:
+        before = f.read()
+    with pytest.raises(ValueError):
+        write_project_dwelling(path, "C", make_state())
+    with open(path, "rb") as f:
+        assert f.read() == before
+
+
+def test_save_overwrites_zip_without_manifest(tmp_path):
+    path = str(tmp_path / "other.dcp")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("readme.txt", "hello")
+    write_project_dwelling(path, "House", make_state())
+    assert list_project_dwellings(path) == ["House"]
+
+
+def test_replace_file_overwrites_unreadable_project(tmp_path):
+    path = str(tmp_path / "street.dcp")
+    write_project_dwelling(path, "A", make_state())
+    rewrite_manifest(path, lambda m: m.update(version=2))
+    write_project_dwelling(path, "C", make_state(), replace_file=True)
+    assert list_project_dwellings(path) == ["C"]
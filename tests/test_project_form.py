@@ -0,0 +1,179 @@
+import os
+import sys
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import demand
+from demand import MAX_DYNAMIC_FIELDS, apply_form_state, collect_form_state, normalize_dwelling_state
+
+FIELD_VARS = (
+    "voltage_var", "area_var", "range_var", "heat_var", "ac_var", "evse_var",
+    "tankless_var_main", "suite_area_var", "suite_range_var", "suite_evse_var",
+    "tankless_var_suite",
+)
+TOGGLE_VARS = ("area_sqft_var", "interlock_var", "suite_var")
+LIST_VARS = (
+    ("additional_vars_main", "additional_entries_main"),
+    ("sps_vars_main", "sps_entries_main"),
+    ("additional_vars_suite", "additional_entries_suite"),
+    ("sps_vars_suite", "sps_entries_suite"),
+)
+
+
+class CountingList(list):
+    """Entry list that counts full passes, i.e. row refreshes that got past the loading guard."""
+
+    passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return super().__iter__()
+
+
+class FakeVar:
+    """Tk variable stand-in: set() runs 'write' traces like Tk does."""
+
+    def __init__(self, value=""):
+        self.value = value
+        self.traces = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for cb in self.traces:
+            cb()
+
+    def trace_add(self, mode, cb):
+        self.traces.append(cb)
+
+
+class FakeWidget:
+    """Widget stand-in tracking grid state and configured options."""
+
+    def __init__(self):
+        self.manager = ""
+        self.options = {}
+
+    def grid(self, **kw):
+        self.manager = "grid"
+
+    def grid_remove(self):
+        self.manager = ""
+
+    def winfo_manager(self):
+        return self.manager
+
+    def config(self, **kw):
+        self.options.update(kw)
+
+    def cget(self, key):
+        return self.options[key]
+
+
+def fake_backend():
+    return SimpleNamespace(
+        string_var=FakeVar, int_var=lambda: FakeVar(0),
+        entry=FakeWidget, label=FakeWidget, frame=FakeWidget, close=lambda: None,
+    )
+
+
+def tk_backend():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    frame = tk.Frame(root)
+    frame.grid()
+    return SimpleNamespace(
+        string_var=lambda: tk.StringVar(root), int_var=lambda: tk.IntVar(root),
+        entry=lambda: tk.Entry(frame), label=lambda: tk.Label(frame),
+        frame=lambda: tk.Frame(frame), close=root.destroy,
+    )
+
+
+@pytest.fixture(params=["fake", "tk"])
+def form(request, monkeypatch):
+    """The variables and widgets the __main__ UI setup builds, on the given backend."""
+    ui = fake_backend() if request.param == "fake" else tk_backend()
+    for name in FIELD_VARS:
+        monkeypatch.setattr(demand, name, ui.string_var(), raising=False)
+    for name in TOGGLE_VARS:
+        monkeypatch.setattr(demand, name, ui.int_var(), raising=False)
+    for vars_name, entries_name in LIST_VARS:
+        vars_list, entries_list = [], CountingList()
+        for _ in range(MAX_DYNAMIC_FIELDS):
+            var = ui.string_var()
+            var.trace_add('write', lambda *_, v=vars_list, e=entries_list: demand.add_dynamic_row_if_needed(v, e))
+            vars_list.append(var)
+            entries_list.append(ui.entry())
+        entries_list[0].grid(row=0, column=0)
+        monkeypatch.setattr(demand, vars_name, vars_list, raising=False)
+        monkeypatch.setattr(demand, entries_name, entries_list, raising=False)
+    monkeypatch.setattr(demand, "area_label_main", ui.label())
+    monkeypatch.setattr(demand, "suite_area_label", ui.label())
+    monkeypatch.setattr(demand, "suite_frame", ui.frame())
+    demand.suite_frame.grid()
+    demand.suite_frame.grid_remove()
+    yield
+    ui.close()
+
+
+def visible_rows(entries_list):
+    return [i for i, ent in enumerate(entries_list) if ent.winfo_manager() == "grid"]
+
+
+STATE = {
+    "fields": {"voltage": "240", "area": "1500", "range": "40", "suite_area": "600"},
+    "toggles": {"area_sqft": 1, "interlock": 1, "suite": 1},
+    "lists": {"additional_main": ["5000", "4500", "6000"], "sps_suite": ["7000"]},
+}
+
+
+def test_apply_refreshes_rows_labels_and_suite(form):
+    apply_form_state(STATE)
+    assert not demand._loading_project
+    assert visible_rows(demand.additional_entries_main) == [0, 1, 2, 3]
+    assert visible_rows(demand.sps_entries_main) == [0]
+    assert visible_rows(demand.sps_entries_suite) == [0, 1]
+    assert demand.suite_frame.winfo_manager() == "grid"
+    assert demand.area_label_main.cget("text") == "Main Area (ft²):"
+    assert demand.suite_area_label.cget("text") == "Suite Area (ft²):"
+
+    apply_form_state({"toggles": {"suite": 0}})
+    assert visible_rows(demand.additional_entries_main) == [0]
+    assert demand.suite_frame.winfo_manager() == ""
+    assert demand.area_label_main.cget("text") == "Main Area (m²):"
+
+
+def test_apply_refreshes_each_dynamic_list_once(form):
+    lists = [getattr(demand, entries_name) for _, entries_name in LIST_VARS]
+    for entries_list in lists:
+        entries_list.passes = 0
+    apply_form_state(STATE)
+    assert [entries_list.passes for entries_list in lists] == [1] * len(LIST_VARS)
+
+
+def test_collect_apply_round_trip(form):
+    apply_form_state(STATE)
+    collected = collect_form_state()
+    assert collected == normalize_dwelling_state(STATE)
+    apply_form_state({})
+    apply_form_state(collected)
+    assert collect_form_state() == collected
+
+
+def test_loading_flag_reset_when_set_fails(form, monkeypatch):
+    class BrokenVar:
+        def set(self, value):
+            raise tk.TclError("boom")
+
+    monkeypatch.setattr(demand, "heat_var", BrokenVar())
+    with pytest.raises(tk.TclError):
+        apply_form_state(STATE)
+    assert demand._loading_project is False